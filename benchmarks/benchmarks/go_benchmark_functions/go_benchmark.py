@@ -12,6 +12,25 @@ except ImportError:
     pass
 
 
+# (lower, upper, N) -> read-only (N, 2) bounds array, shared by all instances
+_uniform_bounds_cache = {}
+
+
+def _uniform_bounds(lower, upper, N):
+    key = (lower, upper, N)
+    try:
+        return _uniform_bounds_cache[key]
+    except KeyError:
+        pass
+
+    bounds = np.empty((N, 2))
+    bounds[:, 0] = lower
+    bounds[:, 1] = upper
+    bounds.flags.writeable = False
+    _uniform_bounds_cache[key] = bounds
+    return bounds
+
+
 class Benchmark(object):
 
     """
@@ -125,6 +144,26 @@ class Benchmark(object):
 
         return False
 
+    def _make_bounds(self, lower, upper):
+        """
+        Uniform bounds for every dimension of the problem.
+
+        Parameters
+        ----------
+        lower : float
+            The lower bound for each of the ``N`` parameters.
+        upper : float
+            The upper bound for each of the ``N`` parameters.
+
+        Returns
+        -------
+        bounds : ndarray
+            A read-only array of shape ``(N, 2)`` whose rows are
+            ``(lower, upper)`` pairs.  The array is shared between all
+            problems with the same bounds and dimensionality.
+        """
+        return _uniform_bounds(float(lower), float(upper), self.N)
+
     def fun(self, x):
         """
         Evaluation of the benchmark function.
@@ -143,6 +182,28 @@ class Benchmark(object):
 
         raise NotImplementedError
 
+    def fun_batch(self, X, *args):
+        """
+        Evaluation of the benchmark function for a population of candidates.
+
+        The default implementation calls ``fun`` once per candidate.
+        Subclasses can override it with a vectorized evaluation.
+
+        Parameters
+        ----------
+        X : array_like
+            The candidate vectors for evaluating the benchmark problem, with
+            shape ``(npop, N)``.
+
+        Returns
+        -------
+        val : ndarray
+              the evaluated benchmark function for each candidate, with
+              shape ``(npop,)``
+        """
+
+        return asarray([self.fun(x, *args) for x in asarray(X)])
+
     def change_dimensions(self, ndim):
         """
         Changes the dimensionality of the benchmark problem
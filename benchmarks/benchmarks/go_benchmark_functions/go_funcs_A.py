@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 from __future__ import division, print_function, absolute_import
 
-from numpy import abs, cos, exp, pi, prod, sin, sqrt, sum
+import math
+
+from numpy import (abs, asarray, cos, dot, einsum, exp, pi, prod, sin, sqrt,
+                   sum, zeros)
 from .go_benchmark import Benchmark
 
 
@@ -35,17 +38,30 @@ class Ackley01(Benchmark):
     def __init__(self, dimensions=2):
         Benchmark.__init__(self, dimensions)
 
-        self._bounds = zip([-35.0] * self.N, [35.0] * self.N)
-        self.global_optimum = [[0 for _ in range(self.N)]]
+        self._bounds = self._make_bounds(-35.0, 35.0)
+        self.global_optimum = zeros((1, self.N))
         self.fglob = 0.0
         self.change_dimensionality = True
 
+        self._two_pi = 2 * pi
+        self._inv_N = 1.0 / self.N
+
     def fun(self, x, *args):
         self.nfev += 1
-        u = sum(x ** 2)
-        v = sum(cos(2 * pi * x))
-        return (-20. * exp(-0.2 * sqrt(u / self.N))
-                - exp(v / self.N) + 20. + exp(1.))
+        u = dot(x, x)
+        t = self._two_pi * x
+        v = sum(cos(t, out=t))
+        return (-20. * math.exp(-0.2 * math.sqrt(u * self._inv_N))
+                - math.exp(v * self._inv_N) + 20. + math.e)
+
+    def fun_batch(self, X, *args):
+        X = asarray(X)
+        self.nfev += X.shape[0]
+        u = einsum('ij,ij->i', X, X)
+        t = self._two_pi * X
+        v = sum(cos(t, out=t), axis=1)
+        return (-20. * exp(-0.2 * sqrt(u * self._inv_N))
+                - exp(v * self._inv_N) + 20. + math.e)
 
 
 class Ackley02(Benchmark):
@@ -73,13 +89,22 @@ class Ackley02(Benchmark):
     def __init__(self, dimensions=2):
         Benchmark.__init__(self, dimensions)
 
-        self._bounds = zip([-32.0] * self.N, [32.0] * self.N)
-        self.global_optimum = [[0 for _ in range(self.N)]]
+        self._bounds = self._make_bounds(-32.0, 32.0)
+        self.global_optimum = zeros((1, self.N))
         self.fglob = -200.
 
     def fun(self, x, *args):
         self.nfev += 1
-        return -200 * exp(-0.02 * sqrt(x[0] ** 2 + x[1] ** 2))
+
+        # scalar problem: math avoids the ufunc overhead of numpy
+        x0, x1 = float(x[0]), float(x[1])
+        return -200 * math.exp(-0.02 * math.sqrt(x0 * x0 + x1 * x1))
+
+    def fun_batch(self, X, *args):
+        X = asarray(X)
+        self.nfev += X.shape[0]
+        x0, x1 = X[:, 0], X[:, 1]
+        return -200 * exp(-0.02 * sqrt(x0 * x0 + x1 * x1))
 
 
 class Ackley03(Benchmark):
@@ -112,14 +137,24 @@ class Ackley03(Benchmark):
     def __init__(self, dimensions=2):
         Benchmark.__init__(self, dimensions)
 
-        self._bounds = zip([-32.0] * self.N, [32.0] * self.N)
+        self._bounds = self._make_bounds(-32.0, 32.0)
         self.global_optimum = [[-0.68255758, -0.36070859]]
         self.fglob = -195.62902825923879
 
     def fun(self, x, *args):
         self.nfev += 1
-        a = -200 * exp(-0.02 * sqrt(x[0] ** 2 + x[1] ** 2))
-        a += 5 * exp(cos(3 * x[0]) + sin(3 * x[1]))
+
+        x0, x1 = float(x[0]), float(x[1])
+        a = -200 * math.exp(-0.02 * math.sqrt(x0 * x0 + x1 * x1))
+        a += 5 * math.exp(math.cos(3 * x0) + math.sin(3 * x1))
+        return a
+
+    def fun_batch(self, X, *args):
+        X = asarray(X)
+        self.nfev += X.shape[0]
+        x0, x1 = X[:, 0], X[:, 1]
+        a = -200 * exp(-0.02 * sqrt(x0 * x0 + x1 * x1))
+        a += 5 * exp(cos(3 * x0) + sin(3 * x1))
         return a
 
 
@@ -154,7 +189,15 @@ class Adjiman(Benchmark):
 
     def fun(self, x, *args):
         self.nfev += 1
-        return cos(x[0]) * sin(x[1]) - x[0] / (x[1] ** 2 + 1)
+
+        x0, x1 = float(x[0]), float(x[1])
+        return math.cos(x0) * math.sin(x1) - x0 / (x1 * x1 + 1)
+
+    def fun_batch(self, X, *args):
+        X = asarray(X)
+        self.nfev += X.shape[0]
+        x0, x1 = X[:, 0], X[:, 1]
+        return cos(x0) * sin(x1) - x0 / (x1 * x1 + 1)
 
 
 class Alpine01(Benchmark):
@@ -185,15 +228,27 @@ class Alpine01(Benchmark):
     def __init__(self, dimensions=2):
         Benchmark.__init__(self, dimensions)
 
-        self._bounds = zip([-10.0] * self.N, [10.0] * self.N)
-        self.global_optimum = [[0 for _ in range(self.N)]]
+        self._bounds = self._make_bounds(-10.0, 10.0)
+        self.global_optimum = zeros((1, self.N))
         self.fglob = 0.0
         self.change_dimensionality = True
 
     def fun(self, x, *args):
         self.nfev += 1
 
-        return sum(abs(x * sin(x) + 0.1 * x))
+        # x * sin(x) + 0.1 * x == x * (sin(x) + 0.1), evaluated in place
+        t = sin(x)
+        t += 0.1
+        t *= x
+        return sum(abs(t, out=t))
+
+    def fun_batch(self, X, *args):
+        X = asarray(X)
+        self.nfev += X.shape[0]
+        t = sin(X)
+        t += 0.1
+        t *= X
+        return sum(abs(t, out=t), axis=1)
 
 
 class Alpine02(Benchmark):
@@ -225,7 +280,7 @@ class Alpine02(Benchmark):
     def __init__(self, dimensions=2):
         Benchmark.__init__(self, dimensions)
 
-        self._bounds = zip([0.0] * self.N, [10.0] * self.N)
+        self._bounds = self._make_bounds(0.0, 10.0)
         self.global_optimum = [[7.91705268, 4.81584232]]
         self.fglob = -6.12950
         self.change_dimensionality = True
@@ -233,7 +288,16 @@ class Alpine02(Benchmark):
     def fun(self, x, *args):
         self.nfev += 1
 
-        return prod(sqrt(x) * sin(x))
+        t = sin(x)
+        t *= sqrt(x)
+        return prod(t)
+
+    def fun_batch(self, X, *args):
+        X = asarray(X)
+        self.nfev += X.shape[0]
+        t = sin(X)
+        t *= sqrt(X)
+        return prod(t, axis=1)
 
 
 class AMGM(Benchmark):
@@ -264,7 +328,7 @@ class AMGM(Benchmark):
     def __init__(self, dimensions=2):
         Benchmark.__init__(self, dimensions)
 
-        self._bounds = zip([0.0] * self.N, [10.0] * self.N)
+        self._bounds = self._make_bounds(0.0, 10.0)
         self.global_optimum = [[1, 1]]
         self.fglob = 0.0
         self.change_dimensionality = True
@@ -276,6 +340,15 @@ class AMGM(Benchmark):
         f2 = prod(x)
         f1 = f1 / self.N
         f2 = f2 ** (1.0 / self.N)
-        f = (f1 - f2) ** 2
+        f = f1 - f2
+
+        return f * f
+
+    def fun_batch(self, X, *args):
+        X = asarray(X)
+        self.nfev += X.shape[0]
+        f1 = sum(X, axis=1) / self.N
+        f2 = prod(X, axis=1) ** (1.0 / self.N)
+        f = f1 - f2
 
-        return f
+        return f * f
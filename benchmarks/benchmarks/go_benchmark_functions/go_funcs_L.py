@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 from __future__ import division, print_function, absolute_import
 
-from numpy import sum, cos, exp, pi, arange, sin
+import math
+
+from numpy import (sum, cos, exp, pi, arange, sin, asarray, einsum, inf, ones,
+                   triu_indices, where)
 from .go_benchmark import Benchmark
 
 
@@ -45,21 +48,35 @@ class Langermann(Benchmark):
     def __init__(self, dimensions=2):
         Benchmark.__init__(self, dimensions)
 
-        self._bounds = zip([0.0] * self.N, [10.0] * self.N)
+        self._bounds = self._make_bounds(0.0, 10.0)
 
         self.global_optimum = [[2.00299219, 1.006096]]
         self.fglob = -5.1621259
 
+        self._a = asarray([3, 5, 2, 1, 7], dtype=float)
+        self._b = asarray([5, 2, 1, 4, 9], dtype=float)
+        self._c = asarray([1, 2, 5, 2, 3], dtype=float)
+        self._inv_pi = 1 / pi
+
     def fun(self, x, *args):
         self.nfev += 1
 
-        a = [3, 5, 2, 1, 7]
-        b = [5, 2, 1, 4, 9]
-        c = [1, 2, 5, 2, 3]
+        dx = x[0] - self._a
+        dy = x[1] - self._b
+        r = dx * dx + dy * dy
+
+        return -sum(self._c * exp(-self._inv_pi * r) * cos(pi * r))
+
+    def fun_batch(self, X, *args):
+        X = asarray(X)
+        self.nfev += X.shape[0]
+
+        # (pop, 5) squared distances to each of the centres
+        dx = X[:, 0:1] - self._a
+        dy = X[:, 1:2] - self._b
+        r = dx * dx + dy * dy
 
-        return (-sum(c * exp(-(1 / pi) * ((x[0] - a) ** 2 +
-                    (x[1] - b) ** 2)) * cos(pi * ((x[0] - a) ** 2
-                                            + (x[1] - b) ** 2))))
+        return -sum(self._c * exp(-self._inv_pi * r) * cos(pi * r), axis=1)
 
 
 class LennardJones(Benchmark):
@@ -112,7 +129,7 @@ class LennardJones(Benchmark):
     def __init__(self, dimensions=6):
         Benchmark.__init__(self, dimensions)
 
-        self._bounds = zip([-4.0] * self.N, [4.0] * self.N)
+        self._bounds = self._make_bounds(-4.0, 4.0)
 
         self.global_optimum = [[]]
 
@@ -127,25 +144,38 @@ class LennardJones(Benchmark):
         self.fglob = minima[k - 2]
         self.change_dimensionality = True
 
+        # atom index pairs i < j, shared by every call to fun
+        self._pairs = triu_indices(k, 1)
+
     def fun(self, x, *args):
         self.nfev += 1
 
         k = int(self.N / 3)
-        s = 0.0
+        p = asarray(x)[:3 * k].reshape(k, 3)
+
+        # squared distances for every pair of atoms i < j
+        i, j = self._pairs
+        d = p[i] - p[j]
+        ed = einsum('ij,ij->i', d, d)
+        ed = ed[ed > 0.0]
+        ud = ed * ed * ed
+
+        return sum((1.0 / ud - 2.0) / ud)
+
+    def fun_batch(self, X, *args):
+        X = asarray(X)
+        self.nfev += X.shape[0]
+
+        k = int(self.N / 3)
+        p = X[:, :3 * k].reshape(X.shape[0], k, 3)
 
-        for i in range(k - 1):
-            for j in range(i + 1, k):
-                a = 3 * i
-                b = 3 * j
-                xd = x[a] - x[b]
-                yd = x[a + 1] - x[b + 1]
-                zd = x[a + 2] - x[b + 2]
-                ed = xd * xd + yd * yd + zd * zd
-                ud = ed * ed * ed
-                if ed > 0.0:
-                    s += (1.0 / ud - 2.0) / ud
+        i, j = self._pairs
+        d = p[:, i] - p[:, j]
+        ed = einsum('pij,pij->pi', d, d)
+        # coincident atoms contribute nothing, as in fun
+        ud = where(ed > 0.0, ed * ed * ed, inf)
 
-        return s
+        return sum((1.0 / ud - 2.0) / ud, axis=1)
 
 
 class Leon(Benchmark):
@@ -174,15 +204,26 @@ class Leon(Benchmark):
     def __init__(self, dimensions=2):
         Benchmark.__init__(self, dimensions)
 
-        self._bounds = zip([-1.2] * self.N, [1.2] * self.N)
+        self._bounds = self._make_bounds(-1.2, 1.2)
 
-        self.global_optimum = [[1 for _ in range(self.N)]]
+        self.global_optimum = ones((1, self.N))
         self.fglob = 0.0
 
     def fun(self, x, *args):
         self.nfev += 1
 
-        return 100. * (x[1] - x[0] ** 2.0) ** 2.0 + (1 - x[0]) ** 2.0
+        x0, x1 = float(x[0]), float(x[1])
+        dx = x1 - x0 * x0
+        dx1 = 1 - x0
+        return 100. * dx * dx + dx1 * dx1
+
+    def fun_batch(self, X, *args):
+        X = asarray(X)
+        self.nfev += X.shape[0]
+        x0, x1 = X[:, 0], X[:, 1]
+        dx = x1 - x0 * x0
+        dx1 = 1 - x0
+        return 100. * dx * dx + dx1 * dx1
 
 
 class Levy03(Benchmark):
@@ -221,19 +262,32 @@ class Levy03(Benchmark):
     def __init__(self, dimensions=2):
         Benchmark.__init__(self, dimensions)
 
-        self._bounds = zip([-10.0] * self.N, [10.0] * self.N)
+        self._bounds = self._make_bounds(-10.0, 10.0)
         self.custom_bounds = [(-5, 5), (-5, 5)]
 
-        self.global_optimum = [[1 for _ in range(self.N)]]
+        self.global_optimum = ones((1, self.N))
         self.fglob = 0.0
 
     def fun(self, x, *args):
         self.nfev += 1
 
-        y = 1 + (x - 1) / 4
-        v = sum((y[:-1] - 1) ** 2 * (1 + 10 * sin(pi * y[1:]) ** 2))
-        z = (y[-1] - 1) ** 2
-        return sin(pi * y[0]) ** 2 + v + z
+        # y - 1 == (x - 1) / 4, so the shifted variable is all that needs
+        # to be stored, and sin(pi * y) is evaluated once for every y_i.
+        d = (x - 1) / 4
+        s = sin(pi * (d + 1))
+        s *= s
+        v = sum(d[:-1] ** 2 * (1 + 10 * s[1:]))
+        return s[0] + v + d[-1] * d[-1]
+
+    def fun_batch(self, X, *args):
+        X = asarray(X)
+        self.nfev += X.shape[0]
+
+        d = (X - 1) / 4
+        s = sin(pi * (d + 1))
+        s *= s
+        v = sum(d[:, :-1] ** 2 * (1 + 10 * s[:, 1:]), axis=1)
+        return s[:, 0] + v + d[:, -1] * d[:, -1]
 
 
 class Levy05(Benchmark):
@@ -260,20 +314,41 @@ class Levy05(Benchmark):
     def __init__(self, dimensions=2):
         Benchmark.__init__(self, dimensions)
 
-        self._bounds = zip([-10.0] * self.N, [10.0] * self.N)
+        self._bounds = self._make_bounds(-10.0, 10.0)
         self.custom_bounds = ([-2.0, 2.0], [-2.0, 2.0])
 
         self.global_optimum = [[-1.30685, -1.42485]]
         self.fglob = -176.1375779
 
+        # summation index i = 1, ..., 5 and the shifted multipliers of x
+        self._i = arange(1.0, 6.0)
+        self._im1 = self._i - 1
+        self._ip1 = self._i + 1
+
     def fun(self, x, *args):
         self.nfev += 1
 
-        i = arange(1, 6)
-        a = i * cos((i - 1) * x[0] + i)
-        b = i * cos((i + 1) * x[1] + i)
+        x0, x1 = float(x[0]), float(x[1])
+        i = self._i
+        a = i * cos(self._im1 * x0 + i)
+        b = i * cos(self._ip1 * x1 + i)
 
-        return sum(a) * sum(b) + (x[0] + 1.42513) ** 2 + (x[1] + 0.80032) ** 2
+        u = x0 + 1.42513
+        v = x1 + 0.80032
+        return float(sum(a) * sum(b)) + u * u + v * v
+
+    def fun_batch(self, X, *args):
+        X = asarray(X)
+        self.nfev += X.shape[0]
+
+        x0, x1 = X[:, 0:1], X[:, 1:2]
+        i = self._i
+        a = sum(i * cos(self._im1 * x0 + i), axis=1)
+        b = sum(i * cos(self._ip1 * x1 + i), axis=1)
+
+        u = X[:, 0] + 1.42513
+        v = X[:, 1] + 0.80032
+        return a * b + u * u + v * v
 
 
 class Levy13(Benchmark):
@@ -304,16 +379,37 @@ class Levy13(Benchmark):
     def __init__(self, dimensions=2):
         Benchmark.__init__(self, dimensions)
 
-        self._bounds = zip([-10.0] * self.N, [10.0] * self.N)
+        self._bounds = self._make_bounds(-10.0, 10.0)
         self.custom_bounds = [(-5, 5), (-5, 5)]
 
-        self.global_optimum = [[1 for _ in range(self.N)]]
+        self.global_optimum = ones((1, self.N))
         self.fglob = 0.0
 
     def fun(self, x, *args):
         self.nfev += 1
 
-        u = sin(3 * pi * x[0]) ** 2
-        v = (x[0] - 1) ** 2 * (1 + (sin(3 * pi * x[1])) ** 2)
-        w = (x[1] - 1) ** 2 * (1 + (sin(2 * pi * x[1])) ** 2)
+        x0, x1 = float(x[0]), float(x[1])
+        s0 = math.sin(3 * math.pi * x0)
+        s1 = math.sin(3 * math.pi * x1)
+        s2 = math.sin(2 * math.pi * x1)
+        d0 = x0 - 1
+        d1 = x1 - 1
+        u = s0 * s0
+        v = d0 * d0 * (1 + s1 * s1)
+        w = d1 * d1 * (1 + s2 * s2)
+        return u + v + w
+
+    def fun_batch(self, X, *args):
+        X = asarray(X)
+        self.nfev += X.shape[0]
+
+        x0, x1 = X[:, 0], X[:, 1]
+        s0 = sin(3 * pi * x0)
+        s1 = sin(3 * pi * x1)
+        s2 = sin(2 * pi * x1)
+        d0 = x0 - 1
+        d1 = x1 - 1
+        u = s0 * s0
+        v = d0 * d0 * (1 + s1 * s1)
+        w = d1 * d1 * (1 + s2 * s2)
         return u + v + w
@@ -5,7 +5,8 @@ from __future__ import division, print_function, absolute_import
 import numpy as np
 from . import go_benchmark_functions as gbf
 import inspect
-from numpy.testing import TestCase, run_module_suite, assert_
+from numpy.testing import (TestCase, run_module_suite, assert_,
+                           assert_allclose)
 
 
 class TestGoBenchmarkFunctions(TestCase):
@@ -40,6 +41,22 @@ class TestGoBenchmarkFunctions(TestCase):
             # should result in an attribute error if it doesn't exist
             val = f.fglob
 
+    def test_fun_batch(self):
+        # Vectorized evaluation over a population should agree with
+        # evaluating each candidate in turn
+        np.random.seed(1234)
+        for name, klass in self.benchmark_functions:
+            if name == 'Benchmark' or 'fun_batch' not in vars(klass):
+                continue
+
+            f = klass()
+            X = np.array([f.initial_vector() for _ in range(10)])
+            expected = np.array([f.fun(x) for x in X])
+            f.nfev = 0
+            assert_allclose(f.fun_batch(X), expected, rtol=1e-12,
+                            err_msg=name)
+            assert_(f.nfev == len(X))
+
 
 if __name__ == '__main__':
     run_module_suite()